@@ -20,7 +20,17 @@ import time
 from datetime import datetime, timedelta
 import webbrowser
 import csv
+import heapq
 import os
+import re
+import queue
+import sys
+from collections import Counter, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import accumulate, count, islice
+from operator import itemgetter
 
 # ---------------------------
 # Configuration / Constants
@@ -28,6 +38,15 @@ import os
 APP_TITLE = "Insider Threat Prediction System - Prototype"
 SIM_EVENT_INTERVAL = 5  # seconds between simulated incoming events
 DEFAULT_THRESHOLD = 0.65
+# retention caps for the in-memory stores (oldest entries are dropped first)
+MAX_EVENTS = 5000
+MAX_ALERTS = 5000
+MAX_AUDIT_ENTRIES = 10000
+DASHBOARD_ALERT_ROWS = 50  # newest alerts shown in the dashboard table
+DASHBOARD_CHART_BARS = 8   # busiest departments drawn in the dashboard chart
+LB_VISIBLE_ROWS = 50       # top analysts listed on the leaderboard
+TS_FORMAT = "%Y-%m-%d %H:%M:%S"  # display / export format for timestamps
+BACKGROUND_POLL_MS = 30    # how often the UI collects finished background work
 
 # Palette & UI constants
 COLOR_BG = "#05070f"
@@ -46,6 +65,7 @@ COLOR_SUCCESS = "#58e6a7"
 COLOR_WARNING = "#f7ad4a"
 COLOR_BORDER = "#1f2a44"
 COLOR_GLOW = "#233866"
+GRADIENT_STEPS = 80  # horizontal bands in the window background gradient
 
 # Simple sentiment lexicon (very small for prototype)
 SENTIMENT_LEXICON = {
@@ -53,6 +73,8 @@ SENTIMENT_LEXICON = {
     "sorry": -0.3, "help": -0.2, "thanks": 0.5, "great": 0.7, "ok": 0.1,
     "urgent": -0.5, "immediately": -0.4, "stressed": -0.8, "happy": 0.8
 }
+_TOKEN_RE = re.compile(r"[A-Za-z']+")
+_LEX_KEYS = frozenset(SENTIMENT_LEXICON)
 
 # Some mock users and departments
 MOCK_USERS = [
@@ -62,61 +84,218 @@ MOCK_USERS = [
     {"user_id": "u004", "name": "Diana", "dept": "Sales"},
     {"user_id": "u005", "name": "Eve", "dept": "Research"},
 ]
+USER_NAME_BY_ID = {u["user_id"]: u["name"] for u in MOCK_USERS}
+
+# ---------------------------
+# Records
+# ---------------------------
+@dataclass(slots=True)
+class Event:
+    event_id: str
+    user: dict            # shared user record (see MOCK_USERS / manual_user)
+    timestamp: float      # epoch seconds
+    off_hours_activity: float
+    file_downloads_last_24h: int
+    usb_activity: int
+    unusual_processes: int
+    message: str
+    sentiment: float
+    sentiment_tag: str    # "pos" / "neg" / "neu"
+
+    @property
+    def timestamp_str(self) -> str:
+        return fmt_ts(self.timestamp)
+
+    @property
+    def user_id(self) -> str:
+        return self.user["user_id"]
+
+    @property
+    def user_name(self) -> str:
+        return self.user["name"]
+
+    @property
+    def dept(self) -> str:
+        return self.user["dept"]
+
+
+# per-feature risk terms; a tuple per alert, turned into a dict only for display
+Contrib = namedtuple("Contrib", "off_hours_activity file_downloads sentiment usb_activity unusual_processes anomaly_boost")
+
+
+@dataclass(slots=True)
+class Alert:
+    alert_id: str
+    event: Event
+    score: float
+    contributions: Contrib
+    created_at: float     # epoch seconds
+    status: str = "New"
+    assigned_to: str | None = None
+    case_id: str | None = None
+    score_str: str = field(init=False, repr=False)       # formatted once for tables
+    severity_tag: str = field(init=False, repr=False)    # "critical" / "high" / ""
+
+    def __post_init__(self):
+        self.score_str = f"{self.score:.2f}"
+        self.severity_tag = "critical" if self.score >= 0.8 else ("high" if self.score >= 0.6 else "")
+
+    @property
+    def created_at_str(self) -> str:
+        return fmt_ts(self.created_at)
+
+
+@dataclass(slots=True)
+class Case:
+    case_id: str
+    alert_id: str
+    user_id: str
+    user_name: str
+    dept: str
+    score: float
+    status: str
+    assigned_to: str | None
+    created_at: float     # epoch seconds
+    score_str: str = field(init=False, repr=False)  # formatted once for tables
+
+    def __post_init__(self):
+        self.score_str = f"{self.score:.2f}"
+
+    @property
+    def created_at_str(self) -> str:
+        return fmt_ts(self.created_at)
+
+
+# one AUDIT_LOG record; timestamp is epoch seconds, score is set for automated actions
+AuditEntry = namedtuple("AuditEntry", "timestamp alert_id action actor score", defaults=(None,))
+
+
+# dashboard table row tags by (severity or status tag, odd row)
+ALERT_ROW_TAGS = {
+    (tag, alt): (("row-alt",) if alt else ()) + ((tag,) if tag else ())
+    for tag in ("critical", "high", "muted", "")
+    for alt in (0, 1)
+}
+MUTED_STATUSES = frozenset(("Mitigated", "Closed"))
+# inbox rows by (sentiment tag, odd row) and case rows by (closed, odd row)
+INBOX_ROW_TAGS = {(tag, alt): (tag, "row-alt") if alt else (tag,) for tag in ("pos", "neg", "neu") for alt in (0, 1)}
+CASE_ROW_TAGS = {
+    (closed, alt): (("row-alt",) if alt else ()) + (("closed",) if closed else ())
+    for closed in (False, True)
+    for alt in (0, 1)
+}
 
 # ---------------------------
 # In-memory stores
 # ---------------------------
-EVENT_STORE = []      # incoming simulated events
-ALERTS = []           # generated alerts
+EVENT_STORE = deque(maxlen=MAX_EVENTS)      # incoming simulated events
+ALERTS = deque(maxlen=MAX_ALERTS)           # generated alerts
 CASES = []            # created cases (after triage)
-AUDIT_LOG = []        # automated actions / decisions
+AUDIT_LOG = deque(maxlen=MAX_AUDIT_ENTRIES)  # automated actions / decisions
+# id indexes over the bounded stores; entries leave together with their record
+EVENTS_BY_ID = {}
+ALERTS_BY_ID = {}
+ALERTS_BY_STATUS = {}  # status -> {alert_id: alert}, in registration order
+CASES_BY_ID = {}
+# running aggregates kept in step with the stores so KPIs never rescan them
+STATS = {
+    "score_sum": 0.0,              # sum of scores over ALERTS
+    "alert_status": Counter(),     # alert status -> count over ALERTS
+    "case_status": Counter(),      # case status -> count over CASES
+    "dept_counts": Counter(),      # dept -> alert count over ALERTS
+    "alerts_registered": 0,        # alerts ever appended (survives eviction)
+    "audits_registered": 0,        # audit entries ever appended
+}
+# events point at the shared MOCK_USERS records instead of copying their fields
+_MANUAL_USERS = {}  # user_id -> record used for what-if events from the Predict tab
+
 USER_POINTS = {u["user_id"]: 0 for u in MOCK_USERS}  # gamification for analysts (simulated)
-BADGES = {u["user_id"]: set() for u in MOCK_USERS}
+# badges are bit flags; names are listed alphabetically so decoding a mask in
+# bit order yields them sorted
+BADGE_NAMES = ("Sandbox Master",)
+BADGE_BITS = {name: 1 << i for i, name in enumerate(BADGE_NAMES)}
+BADGES = {u["user_id"]: 0 for u in MOCK_USERS}  # user_id -> mask of BADGE_BITS
 
 # ---------------------------
 # Utility functions
 # ---------------------------
-def _hex_to_rgb(h: str) -> tuple[int, int, int]:
-    h = h.lstrip("#")
-    return tuple(int(h[i:i+2], 16) for i in (0, 2, 4))
-
-
-def _rgb_to_hex(rgb: tuple[int, int, int]) -> str:
-    return "#{:02x}{:02x}{:02x}".format(*rgb)
+def blend_packed(a: int, b: int, k: int) -> int:
+    """
+    Blend two colors packed as 0xRRGGBB ints; k is the weight of b (0..256).
+    Red and blue are blended together in one multiply (SWAR) since their
+    lanes are 16 bits apart, green separately.
+    """
+    ik = 256 - k
+    rb = (((a & 0xFF00FF) * ik + (b & 0xFF00FF) * k) >> 8) & 0xFF00FF
+    g = (((a & 0x00FF00) * ik + (b & 0x00FF00) * k) >> 8) & 0x00FF00
+    return rb | g
 
 
+@lru_cache(maxsize=1024)
 def blend_hex(color_a: str, color_b: str, t: float) -> str:
     """Blend two hex colors."""
     t = max(0.0, min(1.0, t))
-    ca = _hex_to_rgb(color_a)
-    cb = _hex_to_rgb(color_b)
-    blended = tuple(int(ca[i] + (cb[i] - ca[i]) * t) for i in range(3))
-    return _rgb_to_hex(blended)
+    packed = blend_packed(int(color_a[1:], 16), int(color_b[1:], 16), int(t * 256 + 0.5))
+    return "#%06x" % packed
+
+
+def tail(items, n: int) -> list:
+    """Last n entries of a store, oldest first."""
+    return list(islice(reversed(items), n))[::-1]
+
+# monotonic id sequences; unique for the session without a clock read or RNG draw
+_EV_SEQ = count(1)
+_AL_SEQ = count(1)
+_CS_SEQ = count(1)
+
+def _new_event_id(prefix="ev"):
+    return f"{prefix}_{next(_EV_SEQ):08x}"
+
+def _new_alert_id(prefix="al"):
+    return f"{prefix}_{next(_AL_SEQ):08x}"
 
+def _new_case_id(prefix="case"):
+    return f"{prefix}_{next(_CS_SEQ):08x}"
+
+
+@lru_cache(maxsize=4096)
+def _fmt_sec(sec: int) -> str:
+    return datetime.fromtimestamp(sec).strftime(TS_FORMAT)
+
+def fmt_ts(epoch: float) -> str:
+    """Format an epoch timestamp for display. Records keep raw epoch seconds and
+    are formatted only when shown; the format has one-second resolution, so
+    strftime runs at most once per distinct second."""
+    return _fmt_sec(int(epoch))
 
 def now_ts():
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return _fmt_sec(int(time.time()))
 
+# pure in text; call sentiment_score.cache_clear() if SENTIMENT_LEXICON changes
+@lru_cache(maxsize=2048)
 def sentiment_score(text: str) -> float:
     """
     Very small lexicon-based sentiment scoring.
     Returns score between -1 (very negative) and +1 (very positive).
     """
-    words = [w.strip(".,!?;:").lower() for w in text.split()]
-    if not words:
-        return 0.0
-    s = 0.0
-    count = 0
-    for w in words:
-        if w in SENTIMENT_LEXICON:
-            s += SENTIMENT_LEXICON[w]
-            count += 1
-    if count == 0:
-        # fallback: small neutral noise
+    # the single scoring implementation (sentiment_scores maps over it):
+    # lowercase once and tokenize in C; only lexicon hits reach Python
+    hits = [SENTIMENT_LEXICON[w] for w in _TOKEN_RE.findall(text.lower()) if w in _LEX_KEYS]
+    if not hits:
+        # no lexicon words: neutral
         return 0.0
-    score = s / max(1, count)
     # clamp
-    return max(-1.0, min(1.0, score))
+    return max(-1.0, min(1.0, sum(hits) / len(hits)))
+
+def sentiment_scores(texts) -> list[float]:
+    """Score many messages with sentiment_score; one score per text, in order."""
+    return [sentiment_score(t) for t in texts]
+
+def sentiment_bucket(score: float) -> str:
+    """Classify a sentiment score as "pos", "neg" or "neu"."""
+    return "pos" if score > 0.2 else ("neg" if score < -0.2 else "neu")
+
+SENTIMENT_TONE_LABELS = {"pos": "Positive tone", "neg": "Negative tone", "neu": "Neutral tone"}
 
 def human_readable_score(score: float) -> str:
     return f"{score*100:.0f}%"
@@ -124,132 +303,261 @@ def human_readable_score(score: float) -> str:
 # ---------------------------
 # Prediction model (lightweight)
 # ---------------------------
-def compute_risk(features: dict) -> tuple[float, dict]:
+# weights - tunable
+RISK_WEIGHTS = {
+    "off_hours_activity": 0.30,
+    "file_downloads": 0.25,
+    "sentiment": -0.20,  # more negative sentiment -> higher risk (sentiment negative)
+    "usb_activity": 0.12,
+    "unusual_processes": 0.13
+}
+
+def _risk_kernel(off_hours, downloads, sent, usb, unusual):
     """
-    Compute a risk score from feature dict.
-    Features expected:
-      - off_hours_activity: float (0-1)
-      - file_downloads_last_24h: int
-      - sentiment: float (-1..1)
-      - usb_activity: int (0/1)
-      - unusual_processes: int
-    Returns (score, contributions)
-    Implementation: weighted linear ensemble + anomaly boosts.
+    Scalar scoring core shared by compute_risk and compute_risk_batch.
+    Returns (score, Contrib).
     """
-    # weights - tunable
-    weights = {
-        "off_hours_activity": 0.30,
-        "file_downloads": 0.25,
-        "sentiment": -0.20,  # more negative sentiment -> higher risk (sentiment negative)
-        "usb_activity": 0.12,
-        "unusual_processes": 0.13
-    }
-
+    w = RISK_WEIGHTS
     # normalize file downloads to 0..1 using a simple soft cap
-    downloads_norm = min(1.0, features.get("file_downloads_last_24h", 0) / 50.0)
-
+    downloads_norm = min(1.0, downloads / 50.0)
     # transform sentiment so negative -> positive risk contribution
-    sent = features.get("sentiment", 0.0)
     sent_risk = max(0.0, -sent)  # negative sentiment -> risk; positive sentiment reduces risk
 
-    base = (
-        weights["off_hours_activity"] * features.get("off_hours_activity", 0.0)
-        + weights["file_downloads"] * downloads_norm
-        + weights["sentiment"] * sent
-        + weights["usb_activity"] * (1.0 if features.get("usb_activity", 0) else 0.0)
-        + weights["unusual_processes"] * min(1.0, features.get("unusual_processes", 0) / 5.0)
-    )
+    c_off = w["off_hours_activity"] * off_hours
+    c_dl = w["file_downloads"] * downloads_norm
+    c_sent = w["sentiment"] * sent
+    c_usb = w["usb_activity"] * (1.0 if usb else 0.0)
+    c_unusual = w["unusual_processes"] * min(1.0, unusual / 5.0)
+    base = c_off + c_dl + c_sent + c_usb + c_unusual
 
     # anomaly boost: sudden spike in downloads or multiple adverse signals
     boost = 0.0
-    if features.get("file_downloads_last_24h", 0) > 30:
+    if downloads > 30:
         boost += 0.12
-    if features.get("off_hours_activity", 0.0) > 0.6 and sent_risk > 0.3:
+    if off_hours > 0.6 and sent_risk > 0.3:
         boost += 0.10
-    if features.get("usb_activity", 0) and features.get("file_downloads_last_24h", 0) > 10:
+    if usb and downloads > 10:
         boost += 0.08
 
-    score = base + boost
     # clamp to 0..1
-    score = max(0.0, min(1.0, score))
-    # contributions for explainability
-    contributions = {
-        "off_hours_activity": weights["off_hours_activity"] * features.get("off_hours_activity", 0.0),
-        "file_downloads": weights["file_downloads"] * downloads_norm,
-        "sentiment": weights["sentiment"] * sent,
-        "usb_activity": weights["usb_activity"] * (1.0 if features.get("usb_activity", 0) else 0.0),
-        "unusual_processes": weights["unusual_processes"] * min(1.0, features.get("unusual_processes", 0) / 5.0),
-        "anomaly_boost": boost
-    }
-    return score, contributions
+    score = max(0.0, min(1.0, base + boost))
+    return score, Contrib(c_off, c_dl, c_sent, c_usb, c_unusual, boost)
+
+def contributions_dict(c: Contrib) -> dict:
+    """Feature -> contribution mapping for the explainability panels."""
+    return c._asdict()
+
+def compute_risk(features: dict) -> tuple[float, Contrib]:
+    """
+    Compute a risk score from feature dict.
+    Features expected:
+      - off_hours_activity: float (0-1)
+      - file_downloads_last_24h: int
+      - sentiment: float (-1..1)
+      - usb_activity: int (0/1)
+      - unusual_processes: int
+    Returns (score, Contrib)
+    Implementation: weighted linear ensemble + anomaly boosts.
+    """
+    # contributions for explainability come back as a Contrib
+    return _risk_kernel(
+        features.get("off_hours_activity", 0.0),
+        features.get("file_downloads_last_24h", 0),
+        features.get("sentiment", 0.0),
+        features.get("usb_activity", 0),
+        features.get("unusual_processes", 0),
+    )
+
+def compute_risk_batch(off_hours, downloads, sentiment, usb, unusual) -> tuple[list, list]:
+    """
+    Score many events given one sequence per feature (column layout).
+    Returns (scores, terms) where terms[i] is the Contrib for event i.
+    """
+    rows = list(map(_risk_kernel, off_hours, downloads, sentiment, usb, unusual))
+    return [r[0] for r in rows], [r[1] for r in rows]
 
 # ---------------------------
 # Event / Simulation
 # ---------------------------
+# canned message texts for simulated events; their sentiment never changes
+_SIM_TEXTS = (
+    "Everything is ok, thanks team",
+    "I am stressed and need help immediately",
+    "This is urgent - send the files",
+    "Suspicious activity spotted, please check",
+    "Happy to finish the task",
+    "I hate the new policy",
+    "Please share credentials",
+)
+_SIM_SENTIMENTS = tuple(sentiment_scores(_SIM_TEXTS))
+_SIM_SENTIMENT_TAGS = tuple(sentiment_bucket(s) for s in _SIM_SENTIMENTS)
+
+# feature distributions for simulated telemetry: (values, cumulative weights),
+# so random.choices skips rebuilding the CDF on every draw
+_SIM_OFF_HOURS = ([0.1, 0.3, 0.6, 0.8], list(accumulate([40, 30, 20, 10])))
+_SIM_DOWNLOADS = ([0, 2, 6, 12, 40], list(accumulate([30, 25, 20, 15, 10])))
+_SIM_USB = ([0, 1], list(accumulate([80, 20])))
+_SIM_UNUSUAL = ([0, 1, 2, 3], list(accumulate([50, 30, 15, 5])))
+
+def _draw(pop, cum, n):
+    return random.choices(pop, cum_weights=cum, k=n)
+
+def _make_event(u, off_hours, downloads, usb, unusual, text_idx):
+    ev = Event(
+        event_id=_new_event_id(),
+        user=u,
+        timestamp=time.time(),
+        off_hours_activity=off_hours,
+        file_downloads_last_24h=downloads,
+        usb_activity=usb,
+        unusual_processes=unusual,
+        message=_SIM_TEXTS[text_idx],
+        sentiment=_SIM_SENTIMENTS[text_idx],
+        sentiment_tag=_SIM_SENTIMENT_TAGS[text_idx]
+    )
+    register_event(ev)
+    return ev
+
+def manual_user(user_id: str) -> dict:
+    """Shared record for Predict-tab events, which are filed under the "Manual" dept."""
+    u = _MANUAL_USERS.get(user_id)
+    if u is None:
+        u = _MANUAL_USERS[user_id] = {"user_id": user_id, "name": user_id, "dept": "Manual"}
+    return u
+
 def simulate_event():
     """
     Create a simulated event and return it.
     """
     u = random.choice(MOCK_USERS)
     # simulate features
-    off_hours = random.choices([0.1, 0.3, 0.6, 0.8], weights=[40, 30, 20, 10])[0]
-    downloads = random.choices([0, 2, 6, 12, 40], weights=[30, 25, 20, 15, 10])[0]
-    usb = random.choices([0,1], weights=[80,20])[0]
-    unusual = random.choices([0,1,2,3], weights=[50,30,15,5])[0]
+    off_hours = _draw(*_SIM_OFF_HOURS, 1)[0]
+    downloads = _draw(*_SIM_DOWNLOADS, 1)[0]
+    usb = _draw(*_SIM_USB, 1)[0]
+    unusual = _draw(*_SIM_UNUSUAL, 1)[0]
     # random message text for sentiment
-    texts = [
-        "Everything is ok, thanks team",
-        "I am stressed and need help immediately",
-        "This is urgent - send the files",
-        "Suspicious activity spotted, please check",
-        "Happy to finish the task",
-        "I hate the new policy",
-        "Please share credentials"
-    ]
-    text = random.choice(texts)
-    s = sentiment_score(text)
-    ev = {
-        "event_id": f"ev_{int(time.time()*1000)}_{random.randint(100,999)}",
-        "user_id": u["user_id"],
-        "user_name": u["name"],
-        "dept": u["dept"],
-        "timestamp": datetime.now(),
-        "off_hours_activity": off_hours,
-        "file_downloads_last_24h": downloads,
-        "usb_activity": usb,
-        "unusual_processes": unusual,
-        "message": text,
-        "sentiment": s
-    }
-    EVENT_STORE.append(ev)
-    return ev
+    i = random.randrange(len(_SIM_TEXTS))
+    return _make_event(u, off_hours, downloads, usb, unusual, i)
+
+def simulate_events_batch(n: int) -> list:
+    """
+    Create n simulated events at once.
+    Each feature column is drawn with a single random.choices(k=n) call
+    instead of one call per event.
+    """
+    users = random.choices(MOCK_USERS, k=n)
+    off_hours = _draw(*_SIM_OFF_HOURS, n)
+    downloads = _draw(*_SIM_DOWNLOADS, n)
+    usb = _draw(*_SIM_USB, n)
+    unusual = _draw(*_SIM_UNUSUAL, n)
+    text_idx = random.choices(range(len(_SIM_TEXTS)), k=n)
+    return [_make_event(*row) for row in zip(users, off_hours, downloads, usb, unusual, text_idx)]
 
 # ---------------------------
 # Alert generation & handling
 # ---------------------------
-def process_event_to_alert(ev, threshold=DEFAULT_THRESHOLD):
-    features = {
-        "off_hours_activity": ev["off_hours_activity"],
-        "file_downloads_last_24h": ev["file_downloads_last_24h"],
-        "sentiment": ev["sentiment"],
-        "usb_activity": ev["usb_activity"],
-        "unusual_processes": ev["unusual_processes"]
-    }
-    score, contributions = compute_risk(features)
-    alert = {
-        "alert_id": f"al_{int(time.time()*1000)}_{random.randint(10,99)}",
-        "event": ev,
-        "score": score,
-        "contributions": contributions,
-        "status": "New",
-        "created_at": datetime.now(),
-        "assigned_to": None,
-        "case_id": None
-    }
-    ALERTS.append(alert)
+def _make_alert(ev, score, contributions):
+    alert = Alert(
+        alert_id=_new_alert_id(),
+        event=ev,
+        score=score,
+        contributions=contributions,
+        created_at=time.time()
+    )
+    register_alert(alert)
     # auto-case creation if very high and auto action enabled (handled in UI)
     return alert
 
+def audit(alert_id, action, actor, score=None):
+    """Append an AuditEntry to AUDIT_LOG and return it."""
+    entry = AuditEntry(time.time(), alert_id, action, actor, score)
+    AUDIT_LOG.append(entry)
+    STATS["audits_registered"] += 1
+    return entry
+
+def register_event(ev):
+    """Append an event to EVENT_STORE and keep EVENTS_BY_ID in step."""
+    if len(EVENT_STORE) == EVENT_STORE.maxlen:
+        EVENTS_BY_ID.pop(EVENT_STORE[0].event_id, None)
+    EVENT_STORE.append(ev)
+    EVENTS_BY_ID[ev.event_id] = ev
+
+def register_alert(alert):
+    """Append an alert to ALERTS and keep STATS in step, including evictions."""
+    if len(ALERTS) == ALERTS.maxlen:
+        evicted = ALERTS[0]
+        ALERTS_BY_ID.pop(evicted.alert_id, None)
+        ALERTS_BY_STATUS[evicted.status].pop(evicted.alert_id, None)
+        STATS["score_sum"] -= evicted.score
+        STATS["alert_status"][evicted.status] -= 1
+        depts = STATS["dept_counts"]
+        depts[evicted.event.dept] -= 1
+        if not depts[evicted.event.dept]:
+            del depts[evicted.event.dept]
+    ALERTS.append(alert)
+    ALERTS_BY_ID[alert.alert_id] = alert
+    ALERTS_BY_STATUS.setdefault(alert.status, {})[alert.alert_id] = alert
+    STATS["alerts_registered"] += 1
+    STATS["score_sum"] += alert.score
+    STATS["alert_status"][alert.status] += 1
+    STATS["dept_counts"][alert.event.dept] += 1
+
+def set_alert_status(alert, status):
+    # an alert evicted from ALERTS (e.g. still open in a detail popup) was
+    # already dropped from the per-status counts and buckets by register_alert;
+    # only its own status changes
+    if alert.alert_id in ALERTS_BY_ID:
+        counts = STATS["alert_status"]
+        counts[alert.status] -= 1
+        counts[status] += 1
+        ALERTS_BY_STATUS[alert.status].pop(alert.alert_id, None)
+        ALERTS_BY_STATUS.setdefault(status, {})[alert.alert_id] = alert
+    alert.status = status
+
+def register_case(case):
+    CASES.append(case)
+    CASES_BY_ID.setdefault(case.case_id, case)
+    STATS["case_status"][case.status] += 1
+
+def set_case_status(case, status):
+    STATS["case_status"][case.status] -= 1
+    case.status = status
+    STATS["case_status"][status] += 1
+
+def process_event_to_alert(ev, threshold=DEFAULT_THRESHOLD):
+    # score straight from the event fields; no intermediate features dict
+    score, terms = _risk_kernel(
+        ev.off_hours_activity,
+        ev.file_downloads_last_24h,
+        ev.sentiment,
+        ev.usb_activity,
+        ev.unusual_processes,
+    )
+    return _make_alert(ev, score, terms)
+
+def process_events_to_alerts(events) -> list:
+    """
+    Batch variant of process_event_to_alert: scores all events with
+    compute_risk_batch and returns the created alerts in order.
+    """
+    return triage_batch(events, threshold=0.0)
+
+def triage_batch(events, threshold=DEFAULT_THRESHOLD) -> list:
+    """
+    Score events in one batch and raise alerts only for those scoring at or
+    above threshold (for backfill / replay). Every event is still scored with
+    its per-feature terms; below-threshold events only skip creating and
+    registering an Alert.
+    """
+    scores, terms = compute_risk_batch(
+        [ev.off_hours_activity for ev in events],
+        [ev.file_downloads_last_24h for ev in events],
+        [ev.sentiment for ev in events],
+        [ev.usb_activity for ev in events],
+        [ev.unusual_processes for ev in events],
+    )
+    return [_make_alert(ev, s, t) for ev, s, t in zip(events, scores, terms) if s >= threshold]
+
 # ---------------------------
 # Automated actions
 # ---------------------------
@@ -258,19 +566,10 @@ def take_automated_action(alert, action, actor="system"):
     Simulate taking an automated action. Record in AUDIT_LOG.
     action: str
     """
-    ts = now_ts()
-    log = {
-        "timestamp": ts,
-        "alert_id": alert["alert_id"],
-        "action": action,
-        "actor": actor,
-        "score": alert["score"],
-        "details": f"Action executed: {action}"
-    }
-    AUDIT_LOG.append(log)
+    log = audit(alert.alert_id, action, actor, alert.score)
     # change status if action is remediation
     if action in ("isolate_endpoint", "lock_account"):
-        alert["status"] = "Mitigated"
+        set_alert_status(alert, "Mitigated")
     return log
 
 # ---------------------------
@@ -278,21 +577,23 @@ def take_automated_action(alert, action, actor="system"):
 # ---------------------------
 def export_cases_csv(filepath="cases_export.csv"):
     keys = ["case_id", "alert_id", "user_id", "user_name", "dept", "score", "status", "assigned_to", "created_at"]
-    with open(filepath, "w", newline="", encoding="utf-8") as f:
+    with open(filepath, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(keys)
-        for c in CASES:
-            writer.writerow([
-                c.get("case_id"),
-                c.get("alert_id"),
-                c.get("user_id"),
-                c.get("user_name"),
-                c.get("dept"),
-                f"{c.get('score',0):.3f}",
-                c.get("status"),
-                c.get("assigned_to"),
-                c.get("created_at").strftime("%Y-%m-%d %H:%M:%S")
-            ])
+        writer.writerows(
+            (
+                c.case_id,
+                c.alert_id,
+                c.user_id,
+                c.user_name,
+                c.dept,
+                format(c.score, ".3f"),
+                c.status,
+                c.assigned_to,
+                c.created_at_str
+            )
+            for c in CASES
+        )
     return filepath
 
 # ---------------------------
@@ -310,7 +611,37 @@ class ITSApp(tk.Tk):
         self.background_canvas.place(relx=0, rely=0, relwidth=1, relheight=1)
         # Ensure the canvas sits behind other widgets
         self.background_canvas.lower("all")
-        self.bind("<Configure>", self.draw_background_gradient)
+        self._bg_strip = self.build_gradient_strip()
+        self._bg_image = None
+        self._bg_items = None  # (image, glow oval, accent oval) canvas ids once drawn
+        self._bg_size = None
+        self._bg_redraw_job = None
+        self.bind("<Configure>", self.schedule_background_redraw)
+
+        # Dashboard table bookkeeping: alerts already shown and last rendered state per row
+        self._tree_seen = 0
+        self._tree_row_state = {}
+        self._audit_seen = {}  # audit Text widget -> audits_registered when last drawn
+        self._current_event_id = None  # event shown in the inbox message detail
+        self._lb_row_state = {}  # uid -> (rank, points) last shown in the leaderboard
+        self._case_row_status = []  # status last shown per CASES entry, in CASES order
+        # gauges created by the tab builders
+        self.avg_score_progress = None
+        self.pred_risk_progress = None
+        self.sentiment_progress = None
+        self._bar_items = {}  # dept -> [rect_id, text_id, last drawn (y, length, count) or None if hidden]
+
+        # Background work: pure computations run on a small pool and their results
+        # are handed back through a queue drained on the Tk thread, so widgets and
+        # the shared stores are only ever touched from here
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._results = queue.SimpleQueue()
+        self._jobs_pending = 0
+        self._drain_job = None
+
+        # Coalesced refresh: producers mark views dirty, one idle callback redraws them
+        self._dirty = set()
+        self._refresh_pending = None
 
         # fonts
         self.title_font = font.Font(family="Segoe UI", size=20, weight="bold")
@@ -325,7 +656,9 @@ class ITSApp(tk.Tk):
         self.kpi_new_alerts_var = tk.StringVar(value="0")
         self.kpi_open_cases_var = tk.StringVar(value="0")
         self.kpi_avg_score_var = tk.StringVar(value="0%")
-        self.last_refresh_var = tk.StringVar(value="Syncing...")
+        # time the dashboard data last changed (set when the view is marked
+        # dirty, so it stays accurate while the redraw is deferred)
+        self.last_refresh_var = tk.StringVar(value=f"Updated {now_ts()}")
         self.msg_sentiment_label_var = tk.StringVar(value="Sentiment: N/A")
         self.msg_sentiment_category_var = tk.StringVar(value="Neutral")
         self.sentiment_score_var = tk.DoubleVar(value=0.0)
@@ -344,7 +677,8 @@ class ITSApp(tk.Tk):
         # top controls
         self.auto_action_enabled = tk.BooleanVar(value=False)
         self.auto_threshold = tk.DoubleVar(value=DEFAULT_THRESHOLD)
-        self.auto_threshold.trace_add("write", lambda *args: self.auto_threshold_label_var.set(f"{self.auto_threshold.get():.2f}"))
+        self._threshold_label_job = None
+        self.auto_threshold.trace_add("write", self.schedule_threshold_label)
 
         self.setup_theme()
 
@@ -379,16 +713,24 @@ class ITSApp(tk.Tk):
         for frame, title in self.tab_order:
             self.notebook.add(frame, text=title)
 
+        # Tabs are built the first time they are shown (see ensure_tab_built)
+        self.tab_builders = {
+            self.dashboard_tab: self.build_dashboard,
+            self.predict_tab: self.build_predict_tab,
+            self.inbox_tab: self.build_inbox_tab,
+            self.actions_tab: self.build_actions_tab,
+            self.gamify_tab: self.build_gamify_tab,
+            self.settings_tab: self.build_settings_tab,
+        }
+        self.built_tabs = set()
+        # coalesced-refresh views and the tab each one draws into
+        self.view_tabs = {"dashboard": self.dashboard_tab, "actions": self.actions_tab}
+
         self.build_navbar(self.main_frame)
         self.notebook.pack(fill=tk.BOTH, expand=True, pady=(8, 0))
 
-        # Build each tab
-        self.build_dashboard()
-        self.build_predict_tab()
-        self.build_inbox_tab()
-        self.build_actions_tab()
-        self.build_gamify_tab()
-        self.build_settings_tab()
+        # Only the dashboard is needed up front; the rest build on first visit
+        self.ensure_tab_built(self.dashboard_tab)
 
         self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_change)
 
@@ -520,7 +862,22 @@ class ITSApp(tk.Tk):
             frame = self.tab_order[index][0]
             self.notebook.select(frame)
 
+    def ensure_tab_built(self, tab) -> bool:
+        """Build a tab's widgets on first use. Returns True if it was built just now."""
+        if tab in self.built_tabs:
+            return False
+        self.built_tabs.add(tab)
+        self.tab_builders[tab]()
+        self.apply_scroll_bindtags(tab)
+        # the builder already drew the tab's current state
+        self._dirty.difference_update(v for v, t in self.view_tabs.items() if t is tab)
+        return True
+
     def on_tab_change(self, event=None):
+        self.ensure_tab_built(self.nametowidget(self.notebook.select()))
+        # views left dirty while hidden are redrawn now that their tab is shown
+        if self._dirty and self._refresh_pending is None:
+            self._refresh_pending = self.after_idle(self._do_refresh)
         current = self.notebook.index(self.notebook.select())
         for idx, btn in enumerate(self.nav_buttons):
             if idx == current:
@@ -547,11 +904,20 @@ class ITSApp(tk.Tk):
         return card
 
     def register_card_hover(self, widget, base_style="Card.TFrame", hover_style="CardHover.TFrame"):
+        # ttk frames take no background option, so hover still swaps styles;
+        # track the applied one and skip the Tk call when nothing changes
+        current = [base_style]
+
+        def apply(style):
+            if current[0] != style:
+                current[0] = style
+                widget.configure(style=style)
+
         def on_enter(_):
-            widget.configure(style=hover_style)
+            apply(hover_style)
 
         def on_leave(_):
-            widget.configure(style=base_style)
+            apply(base_style)
 
         widget.bind("<Enter>", on_enter)
         widget.bind("<Leave>", on_leave)
@@ -576,21 +942,33 @@ class ITSApp(tk.Tk):
 
         canvas.bind("<Configure>", on_canvas_config)
 
+        # Wheel scrolling lives on a per-tab bind tag instead of a global
+        # bind_all; apply_scroll_bindtags attaches it once the tab is built.
         def _on_mousewheel(event):
             delta = -1 * int(event.delta / 120)
             canvas.yview_scroll(delta, "units")
 
-        def _bind_mousewheel(_):
-            canvas.bind_all("<MouseWheel>", _on_mousewheel)
-
-        def _unbind_mousewheel(_):
-            canvas.unbind_all("<MouseWheel>")
-
-        canvas.bind("<Enter>", _bind_mousewheel)
-        canvas.bind("<Leave>", _unbind_mousewheel)
+        tag = f"Scroll{id(parent)}"
+        canvas.bind_class(tag, "<MouseWheel>", _on_mousewheel)
+        canvas.bind_class(tag, "<Button-4>", lambda _: canvas.yview_scroll(-1, "units"))
+        canvas.bind_class(tag, "<Button-5>", lambda _: canvas.yview_scroll(1, "units"))
 
         return frame
 
+    def apply_scroll_bindtags(self, tab):
+        """Route wheel events over any widget in a scrollable tab to its canvas.
+        Text and Treeview widgets keep scrolling themselves."""
+        tag = f"Scroll{id(tab)}"
+        stack = [tab]
+        while stack:
+            w = stack.pop()
+            stack.extend(w.winfo_children())
+            if isinstance(w, (tk.Text, ttk.Treeview)):
+                continue
+            tags = w.bindtags()
+            if tag not in tags:
+                w.bindtags((tag,) + tags)
+
     # ---------------------------
     # Dashboard Tab
     # ---------------------------
@@ -686,95 +1064,191 @@ class ITSApp(tk.Tk):
 
         self.refresh_dashboard()
 
+    def run_in_background(self, fn, *args, on_done):
+        """Run fn(*args) on the worker pool; on_done(result) is called on the Tk thread."""
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(lambda f: self._results.put((on_done, f)))
+        self._jobs_pending += 1
+        if self._drain_job is None:
+            self._drain_job = self.after(BACKGROUND_POLL_MS, self._drain_results)
+
+    def _drain_results(self):
+        self._drain_job = None
+        done = []
+        while True:
+            try:
+                done.append(self._results.get_nowait())
+            except queue.Empty:
+                break
+        self._jobs_pending -= len(done)
+        if self._jobs_pending:
+            self._drain_job = self.after(BACKGROUND_POLL_MS, self._drain_results)
+        for on_done, future in done:
+            # a failing job (or its callback) is reported like any Tk callback
+            # error without stranding the results queued behind it
+            try:
+                on_done(future.result())
+            except Exception:
+                self.report_callback_exception(*sys.exc_info())
+
+    def _schedule_refresh(self, *views):
+        """Mark views ("dashboard" by default, "actions") stale; they are redrawn
+        once, when Tk goes idle after the current burst of changes."""
+        views = views or ("dashboard",)
+        if "dashboard" in views:
+            self.last_refresh_var.set(f"Updated {now_ts()}")
+        self._dirty.update(views)
+        if self._refresh_pending is None:
+            self._refresh_pending = self.after_idle(self._do_refresh)
+
+    def _do_refresh(self):
+        # only the visible tab is redrawn; hidden views stay dirty until shown
+        self._refresh_pending = None
+        current = self.notebook.select()
+        for view in [v for v in self._dirty if str(self.view_tabs[v]) == current]:
+            self._dirty.discard(view)
+            if view == "dashboard":
+                self.refresh_dashboard()
+            else:
+                self.refresh_actions()
+
+    def refresh_audit_view(self, view, rows, line):
+        """Keep a Text widget showing the last `rows` audit entries, one line each.
+        Entries only arrive at the tail, so new lines are appended and the same
+        number trimmed from the head; unchanged lines are never rewritten."""
+        registered = STATS["audits_registered"]
+        fresh = min(registered - self._audit_seen.get(view, 0), rows)
+        self._audit_seen[view] = registered
+        if not fresh:
+            return
+        text = "".join(line(l) for l in tail(AUDIT_LOG, fresh))
+        if fresh == rows:
+            view.delete("1.0", tk.END)
+            view.insert(tk.END, text)
+            return
+        view.insert(tk.END, text)
+        # every line ends in a newline, so "end-1c" sits on the empty line after the last one
+        excess = int(view.index("end-1c").split(".")[0]) - 1 - rows
+        if excess > 0:
+            view.delete("1.0", f"{excess + 1}.0")
+
     def refresh_dashboard(self):
         # KPIs
-        new_alerts = sum(1 for a in ALERTS if a["status"] == "New")
+        new_alerts = STATS["alert_status"]["New"]
         open_cases = len(CASES)
-        avg_score = (sum(a["score"] for a in ALERTS) / max(1, len(ALERTS)))
+        avg_score = STATS["score_sum"] / max(1, len(ALERTS))
         self.kpi_new_alerts_var.set(str(new_alerts))
         self.kpi_open_cases_var.set(str(open_cases))
         self.kpi_avg_score_var.set(f"{avg_score*100:.0f}%")
-        if hasattr(self, "avg_score_progress") and self.avg_score_progress:
+        if self.avg_score_progress is not None:
             self.avg_score_progress["value"] = avg_score * 100
-        self.last_refresh_var.set(f"Updated {now_ts()}")
-
-        # Refresh tree
-        for i in self.alerts_tree.get_children():
-            self.alerts_tree.delete(i)
-        sorted_alerts = sorted(ALERTS, key=lambda x: x["created_at"], reverse=True)
-        for idx, a in enumerate(sorted_alerts[:50]):
-            tags = []
-            if idx % 2 == 1:
-                tags.append("row-alt")
-            if a["score"] >= 0.8:
-                tags.append("critical")
-            elif a["score"] >= 0.6:
-                tags.append("high")
-            elif a["status"] in ("Mitigated", "Closed"):
-                tags.append("muted")
-            self.alerts_tree.insert("", tk.END, values=(
-                a["alert_id"],
-                a["event"]["user_name"],
-                a["event"]["dept"],
-                f"{a['score']:.2f}",
-                a["status"],
-                a["created_at"].strftime("%Y-%m-%d %H:%M:%S")
-            ), tags=tuple(tags))
-
-        # Draw simple bar chart: top departments by alerts
-        dept_counts = {}
-        for a in ALERTS:
-            dept_counts[a["event"]["dept"]] = dept_counts.get(a["event"]["dept"], 0) + 1
-        items = sorted(dept_counts.items(), key=lambda x: x[1], reverse=True)
-        self.canvas.delete("all")
-        if items:
-            maxv = max(v for _, v in items)
-            x0 = 20
-            y = 20
-            for dept, v in items:
-                bar_len = int((v / maxv) * 260)
-                color = COLOR_ACCENT if bar_len < 180 else COLOR_ACCENT_ALT
-                self.canvas.create_rectangle(x0, y, x0+bar_len, y+24, fill=color, outline=color)
-                self.canvas.create_text(x0+bar_len+40, y+12, text=f"{dept} ({v})", anchor="w", fill=COLOR_TEXT, font=self.body_font)
-                y += 36
+
+        # Refresh tree: rows mirror the newest alerts, newest first, keyed by
+        # alert_id. Only alerts registered since the last pass are inserted and
+        # overflow rows trimmed; existing rows are touched only when their
+        # status or stripe changes.
+        tree = self.alerts_tree
+        registered = STATS["alerts_registered"]
+        fresh = min(registered - self._tree_seen, len(ALERTS), DASHBOARD_ALERT_ROWS)
+        self._tree_seen = registered
+        for a in tail(ALERTS, fresh):
+            tree.insert("", 0, iid=a.alert_id)
+        rows = tree.get_children()
+        if len(rows) > DASHBOARD_ALERT_ROWS:
+            stale = rows[DASHBOARD_ALERT_ROWS:]
+            tree.delete(*stale)
+            for iid in stale:
+                self._tree_row_state.pop(iid, None)
+            rows = rows[:DASHBOARD_ALERT_ROWS]
+        row_state = self._tree_row_state
+        item = tree.item
+        row_tags = ALERT_ROW_TAGS
+        muted = MUTED_STATUSES
+        for idx, a in enumerate(islice(reversed(ALERTS), len(rows))):
+            iid = a.alert_id
+            state = (a.status, idx % 2)
+            prev = row_state.get(iid)
+            if prev == state:
+                continue
+            row_state[iid] = state
+            tag = a.severity_tag or ("muted" if a.status in muted else "")
+            tags = row_tags[tag, idx & 1]
+            if prev is not None and prev[0] == a.status:
+                item(iid, tags=tags)
+                continue
+            item(iid, values=(a.alert_id, a.event.user_name, a.event.dept, a.score_str, a.status, a.created_at_str), tags=tags)
+
+        # Draw simple bar chart: top departments by alerts. Each dept keeps its
+        # rectangle/label items; they are reshaped only when the bar changes
+        # and hidden (not deleted) when the dept drops out.
+        items = STATS["dept_counts"].most_common(DASHBOARD_CHART_BARS)
+        canvas = self.canvas
+        bars = self._bar_items
+        maxv = items[0][1] if items else 1
+        x0 = 20
+        y = 20
+        shown = set()
+        for dept, v in items:
+            bar_len = int((v / maxv) * 260)
+            color = COLOR_ACCENT if bar_len < 180 else COLOR_ACCENT_ALT
+            state = (y, bar_len, v)
+            bar = bars.get(dept)
+            if bar is None:
+                rect = canvas.create_rectangle(x0, y, x0+bar_len, y+24, fill=color, outline=color)
+                text = canvas.create_text(x0+bar_len+40, y+12, text=f"{dept} ({v})", anchor="w", fill=COLOR_TEXT, font=self.body_font)
+                bars[dept] = [rect, text, state]
+            elif bar[2] != state:
+                rect, text, _ = bar
+                canvas.coords(rect, x0, y, x0+bar_len, y+24)
+                canvas.itemconfigure(rect, fill=color, outline=color, state="normal")
+                canvas.coords(text, x0+bar_len+40, y+12)
+                canvas.itemconfigure(text, text=f"{dept} ({v})", state="normal")
+                bar[2] = state
+            shown.add(dept)
+            y += 36
+        for dept, bar in bars.items():
+            if bar[2] is not None and dept not in shown:
+                canvas.itemconfigure(bar[0], state="hidden")
+                canvas.itemconfigure(bar[1], state="hidden")
+                bar[2] = None
 
         # Audit log
-        self.audit_list.delete("1.0", tk.END)
-        for l in AUDIT_LOG[-10:]:
-            self.audit_list.insert(tk.END, f"{l['timestamp']} | {l['action']} | {l['alert_id']} | {l['actor']}\n")
+        self.refresh_audit_view(
+            self.audit_list, 10,
+            lambda l: f"{fmt_ts(l.timestamp)} | {l.action} | {l.alert_id} | {l.actor}\n",
+        )
 
     def on_alert_double_click(self, event):
         sel = self.alerts_tree.selection()
         if not sel:
             return
-        vals = self.alerts_tree.item(sel[0])["values"]
-        alert_id = vals[0]
-        alert = next((a for a in ALERTS if a["alert_id"] == alert_id), None)
+        alert = ALERTS_BY_ID.get(sel[0])  # rows use the alert_id as their iid
         if alert:
             self.open_alert_detail(alert)
 
     def open_alert_detail(self, alert):
         # popup window with explainability and actions
         w = tk.Toplevel(self)
-        w.title(f"Alert Detail - {alert['alert_id']}")
+        w.title(f"Alert Detail - {alert.alert_id}")
         w.configure(bg=COLOR_BG)
         container = ttk.Frame(w, style="Main.TFrame", padding=18)
         container.pack(fill=tk.BOTH, expand=True)
-        ttk.Label(container, text=f"User: {alert['event']['user_name']} ({alert['event']['user_id']})", style="Title.TLabel").pack(anchor="w")
-        ttk.Label(container, text=f"Dept: {alert['event']['dept']}  |  Created: {alert['created_at'].strftime('%Y-%m-%d %H:%M:%S')}", style="Subtitle.TLabel").pack(anchor="w", pady=(0,8))
+        ev = alert.event
+        ttk.Label(container, text=f"User: {ev.user_name} ({ev.user_id})", style="Title.TLabel").pack(anchor="w")
+        ttk.Label(container, text=f"Dept: {ev.dept}  |  Created: {alert.created_at_str}", style="Subtitle.TLabel").pack(anchor="w", pady=(0,8))
 
         # Contribution list
         frame = ttk.Frame(container, style="Card.TFrame", padding=12)
         frame.pack(fill=tk.BOTH, expand=True)
         ttk.Label(frame, text="Risk Score", font=self.header_font).pack(anchor="w")
-        ttk.Label(frame, text=f"{alert['score']:.3f} ({human_readable_score(alert['score'])})").pack(anchor="w")
+        ttk.Label(frame, text=f"{alert.score:.3f} ({human_readable_score(alert.score)})").pack(anchor="w")
         ttk.Label(frame, text="Top contributing features:", font=self.header_font).pack(anchor="w", pady=(8,2))
-        for k,v in alert["contributions"].items():
+        for k,v in contributions_dict(alert.contributions).items():
             ttk.Label(frame, text=f"{k}: {v:.3f}").pack(anchor="w")
 
         ttk.Label(frame, text="Message:", font=self.header_font).pack(anchor="w", pady=(8,2))
         msg = tk.Text(frame, height=4, wrap=tk.WORD)
-        msg.insert(tk.END, alert["event"]["message"])
+        msg.insert(tk.END, alert.event.message)
         msg.config(state=tk.DISABLED)
         self.style_text_widget(msg)
         msg.pack(fill=tk.X)
@@ -790,37 +1264,39 @@ class ITSApp(tk.Tk):
     def assign_alert(self, alert, parent_w):
         # simple assign to random analyst (using MOCK_USERS as analyst pool)
         analyst = random.choice(MOCK_USERS)
-        alert["assigned_to"] = analyst["user_id"]
-        alert["status"] = "Triaged"
-        messagebox.showinfo("Assigned", f"Alert {alert['alert_id']} assigned to {analyst['name']}")
-        AUDIT_LOG.append({"timestamp": now_ts(), "alert_id": alert["alert_id"], "action": "assigned", "actor": "gui"})
-        self.refresh_dashboard()
+        alert.assigned_to = analyst["user_id"]
+        set_alert_status(alert, "Triaged")
+        messagebox.showinfo("Assigned", f"Alert {alert.alert_id} assigned to {analyst['name']}")
+        audit(alert.alert_id, "assigned", "gui")
+        self._schedule_refresh()
         parent_w.lift()
 
     def create_case_from_alert(self, alert, parent_w):
-        case = {
-            "case_id": f"case_{int(time.time()*1000)}",
-            "alert_id": alert["alert_id"],
-            "user_id": alert["event"]["user_id"],
-            "user_name": alert["event"]["user_name"],
-            "dept": alert["event"]["dept"],
-            "score": alert["score"],
-            "status": "Open",
-            "assigned_to": alert.get("assigned_to"),
-            "created_at": datetime.now()
-        }
-        CASES.append(case)
-        alert["case_id"] = case["case_id"]
-        alert["status"] = "Under Investigation"
-        messagebox.showinfo("Case Created", f"Case {case['case_id']} created from alert {alert['alert_id']}")
-        AUDIT_LOG.append({"timestamp": now_ts(), "alert_id": alert["alert_id"], "action": "case_created", "actor": "gui"})
-        self.refresh_dashboard()
+        ev = alert.event
+        case = Case(
+            case_id=_new_case_id(),
+            alert_id=alert.alert_id,
+            user_id=ev.user_id,
+            user_name=ev.user_name,
+            dept=ev.dept,
+            score=alert.score,
+            status="Open",
+            assigned_to=alert.assigned_to,
+            created_at=time.time()
+        )
+        register_case(case)
+        alert.case_id = case.case_id
+        set_alert_status(alert, "Under Investigation")
+        messagebox.showinfo("Case Created", f"Case {case.case_id} created from alert {alert.alert_id}")
+        audit(alert.alert_id, "case_created", "gui")
+        self._schedule_refresh("dashboard", "actions")
         parent_w.lift()
 
     def open_mail(self, alert):
         # open default mail client with a templated mail (mailto)
-        subject = f"Security Alert: {alert['alert_id']} - {alert['event']['user_name']}"
-        body = f"Dear Security Team,%0A%0AWe detected a risk score of {alert['score']:.2f} for user {alert['event']['user_name']} ({alert['event']['user_id']}).%0APlease review the alert: {alert['alert_id']}%0A%0AThanks."
+        ev = alert.event
+        subject = f"Security Alert: {alert.alert_id} - {ev.user_name}"
+        body = f"Dear Security Team,%0A%0AWe detected a risk score of {alert.score:.2f} for user {ev.user_name} ({ev.user_id}).%0APlease review the alert: {alert.alert_id}%0A%0AThanks."
         url = f"mailto:security@example.com?subject={subject}&body={body}"
         webbrowser.open(url)
 
@@ -830,12 +1306,12 @@ class ITSApp(tk.Tk):
             return
         # follow approval gate logic: only auto isolate if score > threshold and auto_action_enabled
         thr = self.auto_threshold.get()
-        if alert["score"] >= thr:
+        if alert.score >= thr:
             take_automated_action(alert, "isolate_endpoint", actor="auto-system")
-            messagebox.showinfo("Auto-Remediation", f"Auto action taken for {alert['alert_id']} (isolate_endpoint)")
-            self.refresh_dashboard()
+            messagebox.showinfo("Auto-Remediation", f"Auto action taken for {alert.alert_id} (isolate_endpoint)")
+            self._schedule_refresh()
         else:
-            messagebox.showinfo("Auto-Remediation Skipped", f"Alert {alert['alert_id']} score below threshold ({alert['score']:.2f} < {thr:.2f})")
+            messagebox.showinfo("Auto-Remediation Skipped", f"Alert {alert.alert_id} score below threshold ({alert.score:.2f} < {thr:.2f})")
 
     def export_cases(self):
         fp = export_cases_csv()
@@ -924,11 +1400,11 @@ class ITSApp(tk.Tk):
     def manual_simulate_event(self):
         ev = simulate_event()
         alert = process_event_to_alert(ev)
-        messagebox.showinfo("Event Simulated", f"Simulated event for {ev['user_name']} created as alert {alert['alert_id']}")
+        messagebox.showinfo("Event Simulated", f"Simulated event for {ev.user_name} created as alert {alert.alert_id}")
         # Auto-handle if auto enabled
-        if self.auto_action_enabled.get() and alert["score"] >= self.auto_threshold.get():
+        if self.auto_action_enabled.get() and alert.score >= self.auto_threshold.get():
             take_automated_action(alert, "isolate_endpoint", actor="auto-sim")
-        self.refresh_dashboard()
+        self._schedule_refresh()
 
     def compute_manual_risk(self):
         user = self.user_var.get().split(" - ")[0]
@@ -937,7 +1413,13 @@ class ITSApp(tk.Tk):
         usb = self.usb_var.get()
         unusual = self.unusual_var.get()
         text = self.msg_entry.get("1.0", tk.END).strip()
-        sent = sentiment_score(text)
+        # score the message off the Tk thread; the rest continues once it is back
+        self.run_in_background(
+            sentiment_score, text,
+            on_done=lambda sent: self.show_manual_risk(user, off, downloads, usb, unusual, text, sent)
+        )
+
+    def show_manual_risk(self, user, off, downloads, usb, unusual, text, sent):
         features = {
             "off_hours_activity": off,
             "file_downloads_last_24h": downloads,
@@ -947,44 +1429,39 @@ class ITSApp(tk.Tk):
         }
         score, contributions = compute_risk(features)
         self.pred_score_text_var.set(f"Score: {score:.3f} ({human_readable_score(score)})")
-        if hasattr(self, "pred_risk_progress"):
+        if self.pred_risk_progress is not None:
             self.pred_risk_progress["value"] = score * 100
         self.pred_explain.delete("1.0", tk.END)
-        self.pred_explain.insert(tk.END, f"Features:\n")
-        for k, v in features.items():
-            self.pred_explain.insert(tk.END, f"  {k}: {v}\n")
-        self.pred_explain.insert(tk.END, "\nContributions:\n")
-        for k, v in contributions.items():
-            self.pred_explain.insert(tk.END, f"  {k}: {v:.3f}\n")
+        lines = ["Features:"]
+        lines += [f"  {k}: {v}" for k, v in features.items()]
+        lines.append("\nContributions:")
+        lines += [f"  {k}: {v:.3f}" for k, v in contributions_dict(contributions).items()]
+        self.pred_explain.insert(tk.END, "\n".join(lines) + "\n")
         # If user wants, create an alert from this manual run
         if messagebox.askyesno("Create Alert?", "Do you want to create an alert from this prediction?"):
-            ev = {
-                "event_id": f"ev_manual_{int(time.time())}",
-                "user_id": user,
-                "user_name": user,
-                "dept": "Manual",
-                "timestamp": datetime.now(),
-                "off_hours_activity": off,
-                "file_downloads_last_24h": downloads,
-                "usb_activity": usb,
-                "unusual_processes": unusual,
-                "message": text,
-                "sentiment": sent
-            }
-            EVENT_STORE.append(ev)
-            alert = {
-                "alert_id": f"al_manual_{int(time.time())}",
-                "event": ev,
-                "score": score,
-                "contributions": contributions,
-                "status": "New",
-                "created_at": datetime.now(),
-                "assigned_to": None,
-                "case_id": None
-            }
-            ALERTS.append(alert)
-            messagebox.showinfo("Alert Created", f"Alert {alert['alert_id']} created.")
-            self.refresh_dashboard()
+            ev = Event(
+                event_id=_new_event_id("ev_manual"),
+                user=manual_user(user),
+                timestamp=time.time(),
+                off_hours_activity=off,
+                file_downloads_last_24h=downloads,
+                usb_activity=usb,
+                unusual_processes=unusual,
+                message=text,
+                sentiment=sent,
+                sentiment_tag=sentiment_bucket(sent)
+            )
+            register_event(ev)
+            alert = Alert(
+                alert_id=_new_alert_id("al_manual"),
+                event=ev,
+                score=score,
+                contributions=contributions,
+                created_at=time.time()
+            )
+            register_alert(alert)
+            messagebox.showinfo("Alert Created", f"Alert {alert.alert_id} created.")
+            self._schedule_refresh()
 
     # ---------------------------
     # Inbox / Sentiment Tab
@@ -1050,20 +1527,21 @@ class ITSApp(tk.Tk):
         self.run_sentiment_scan()
 
     def run_sentiment_scan(self):
+        if self.ensure_tab_built(self.inbox_tab):
+            return  # building the inbox ran the scan
         # Build inbox from recent events
         self.inbox_tree.delete(*self.inbox_tree.get_children())
         # show last 50 messages
-        msgs = EVENT_STORE[-50:]
         counts = {"pos": 0, "neg": 0, "neu": 0}
-        for idx, m in enumerate(reversed(msgs)):
-            s = m["sentiment"]
-            tag = "pos" if s > 0.2 else ("neg" if s < -0.2 else "neu")
+        insert = self.inbox_tree.insert
+        end = tk.END
+        row_tags = INBOX_ROW_TAGS
+        for idx, m in enumerate(islice(reversed(EVENT_STORE), 50)):
+            s = m.sentiment
+            tag = m.sentiment_tag
             counts[tag] += 1
-            tags = [tag]
-            if idx % 2 == 1:
-                tags.append("row-alt")
-            display_text = (m["message"][:40] + "...") if len(m["message"])>40 else m["message"]
-            self.inbox_tree.insert("", tk.END, values=(display_text, m["user_name"], f"{s:.2f}", m["timestamp"].strftime("%Y-%m-%d %H:%M:%S")), tags=tuple(tags))
+            display_text = (m.message[:40] + "...") if len(m.message)>40 else m.message
+            insert("", end, iid=m.event_id, values=(display_text, m.user_name, f"{s:.2f}", m.timestamp_str), tags=row_tags[tag, idx & 1])
         self.inbox_positive_var.set(f"{counts['pos']} positive")
         self.inbox_negative_var.set(f"{counts['neg']} negative")
         self.inbox_neutral_var.set(f"{counts['neu']} neutral")
@@ -1072,35 +1550,29 @@ class ITSApp(tk.Tk):
         sel = self.inbox_tree.selection()
         if not sel:
             return
-        vals = self.inbox_tree.item(sel[0])["values"]
-        ts = vals[3]
-        # find the event by timestamp
-        ev = next((e for e in EVENT_STORE if e["timestamp"].strftime("%Y-%m-%d %H:%M:%S")==ts), None)
+        ev = EVENTS_BY_ID.get(sel[0])  # inbox rows use the event_id as their iid
         if ev:
+            self._current_event_id = ev.event_id
             self.msg_detail.delete("1.0", tk.END)
-            self.msg_detail.insert(tk.END, f"From: {ev['user_name']} ({ev['user_id']})\nDept: {ev['dept']}\nTime: {ev['timestamp']}\n\n")
-            self.msg_detail.insert(tk.END, ev["message"])
-            s = ev["sentiment"]
+            self.msg_detail.insert(tk.END, f"From: {ev.user_name} ({ev.user_id})\nDept: {ev.dept}\nTime: {ev.timestamp_str}\n\n{ev.message}")
+            s = ev.sentiment
             self.msg_sentiment_label_var.set(f"Sentiment score: {s:.2f}")
-            category = "Positive tone" if s > 0.2 else ("Negative tone" if s < -0.2 else "Neutral tone")
-            self.msg_sentiment_category_var.set(category)
-            if hasattr(self, "sentiment_progress"):
+            self.msg_sentiment_category_var.set(SENTIMENT_TONE_LABELS[ev.sentiment_tag])
+            if self.sentiment_progress is not None:
                 self.sentiment_progress["value"] = (s + 1) * 50
 
     def flag_message_create_alert(self):
-        txt = self.msg_detail.get("1.0", tk.END)
-        if not txt.strip():
+        if self._current_event_id is None:
             messagebox.showwarning("No Message", "Open a message first by double-clicking an item in the inbox.")
             return
-        # find anchor by searching message substring in EVENT_STORE
-        excerpt = txt.strip().splitlines()[-1][:80]
-        ev = next((e for e in EVENT_STORE if excerpt in e["message"]), None)
+        # the open message remembers its event; it may since have been evicted
+        ev = EVENTS_BY_ID.get(self._current_event_id)
         if not ev:
             messagebox.showerror("Not Found", "Could not find event to create alert from.")
             return
         alert = process_event_to_alert(ev)
-        messagebox.showinfo("Alert Created", f"Alert {alert['alert_id']} created from message.")
-        self.refresh_dashboard()
+        messagebox.showinfo("Alert Created", f"Alert {alert.alert_id} created from message.")
+        self._schedule_refresh()
 
     # ---------------------------
     # Automated Actions / Cases Tab
@@ -1157,8 +1629,7 @@ class ITSApp(tk.Tk):
         threshold_frame.pack(fill=tk.X, pady=(6, 6))
         ttk.Label(threshold_frame, text="Auto Threshold ≥", style="InfoLabel.TLabel").pack(anchor="w")
         ttk.Label(threshold_frame, textvariable=self.auto_threshold_label_var, style="InfoValue.TLabel").pack(anchor="w")
-        ttk.Scale(right, from_=0.0, to=1.0, orient=tk.HORIZONTAL, variable=self.auto_threshold,
-                  command=lambda v: self.auto_threshold_label_var.set(f"{float(v):.2f}")).pack(fill=tk.X)
+        ttk.Scale(right, from_=0.0, to=1.0, orient=tk.HORIZONTAL, variable=self.auto_threshold).pack(fill=tk.X)
         ttk.Button(right, text="Run Auto Action Sweep", style="Accent.TButton", command=self.run_auto_sweep).pack(fill=tk.X, pady=(16, 10))
         ttk.Button(right, text="Refresh Cases", style="Ghost.TButton", command=self.refresh_actions).pack(fill=tk.X)
 
@@ -1170,72 +1641,78 @@ class ITSApp(tk.Tk):
         self.refresh_actions()
 
     def refresh_actions(self):
-        # refresh cases
-        for i in self.cases_tree.get_children():
-            self.cases_tree.delete(i)
-        for idx, c in enumerate(sorted(CASES, key=lambda x: x["created_at"], reverse=True)):
-            tags = ["row-alt"] if idx % 2 == 1 else []
-            if c["status"] == "Closed":
-                tags.append("closed")
-            self.cases_tree.insert("", tk.END, values=(
-                c["case_id"],
-                c["alert_id"],
-                c["user_name"],
-                c["dept"],
-                f"{c['score']:.2f}",
-                c["status"],
-                c["created_at"].strftime("%Y-%m-%d %H:%M:%S")
-            ), tags=tuple(tags))
-        open_cases = sum(1 for c in CASES if c["status"] in ("Open", "Under Investigation"))
-        closed_cases = sum(1 for c in CASES if c["status"] == "Closed")
-        mitigated_alerts = sum(1 for a in ALERTS if a["status"] == "Mitigated")
+        # refresh cases: rows are keyed by case_id, newest first. CASES only
+        # grows, so new cases are inserted at the top and existing rows are
+        # rewritten only when their status changed. Stripes follow a case's
+        # position in CASES, so inserting at the top never restripes old rows.
+        tree = self.cases_tree
+        row_tags = CASE_ROW_TAGS
+        shown = self._case_row_status
+        for idx, status in enumerate(shown):
+            c = CASES[idx]
+            if c.status != status:
+                shown[idx] = c.status
+                tree.item(c.case_id, values=(
+                    c.case_id, c.alert_id, c.user_name, c.dept, c.score_str, c.status, c.created_at_str
+                ), tags=row_tags[c.status == "Closed", idx & 1])
+        insert = tree.insert
+        for idx in range(len(shown), len(CASES)):
+            c = CASES[idx]
+            shown.append(c.status)
+            insert("", 0, iid=c.case_id, values=(
+                c.case_id, c.alert_id, c.user_name, c.dept, c.score_str, c.status, c.created_at_str
+            ), tags=row_tags[c.status == "Closed", idx & 1])
+        case_status = STATS["case_status"]
+        open_cases = case_status["Open"] + case_status["Under Investigation"]
+        closed_cases = case_status["Closed"]
+        mitigated_alerts = STATS["alert_status"]["Mitigated"]
         self.case_open_var.set(f"{open_cases} open")
         self.case_closed_var.set(f"{closed_cases} closed")
         self.case_mitigated_var.set(f"{mitigated_alerts} mitigated")
         # audit
-        self.actions_audit.delete("1.0", tk.END)
-        for l in AUDIT_LOG[-20:]:
-            self.actions_audit.insert(tk.END, f"{l['timestamp']} | {l['action']} | {l['alert_id']}\n")
+        self.refresh_audit_view(
+            self.actions_audit, 20,
+            lambda l: f"{fmt_ts(l.timestamp)} | {l.action} | {l.alert_id}\n",
+        )
 
     def run_auto_sweep(self):
         thr = self.auto_threshold.get()
         if not self.auto_action_enabled.get():
             messagebox.showwarning("Disabled", "Enable auto-remediation first.")
             return
-        cnt = 0
-        for a in list(ALERTS):
-            if a["status"] in ("Mitigated", "Under Investigation"):
-                continue
-            if a["score"] >= thr:
-                take_automated_action(a, "isolate_endpoint", actor="auto-sweep")
-                cnt += 1
+        # only alerts still awaiting action are visited; the candidates are
+        # collected first because each action moves its alert to "Mitigated"
+        targets = [a for status, bucket in ALERTS_BY_STATUS.items()
+                   if status not in ("Mitigated", "Under Investigation")
+                   for a in bucket.values() if a.score >= thr]
+        for a in targets:
+            take_automated_action(a, "isolate_endpoint", actor="auto-sweep")
+        cnt = len(targets)
         messagebox.showinfo("Auto Sweep Complete", f"Actions taken on {cnt} alerts.")
-        self.refresh_dashboard()
-        self.refresh_actions()
+        self._schedule_refresh("dashboard", "actions")
 
     def on_case_open(self, event):
         sel = self.cases_tree.selection()
         if not sel:
             return
-        vals = self.cases_tree.item(sel[0])["values"]
-        case_id = vals[0]
-        case = next((c for c in CASES if c["case_id"] == case_id), None)
+        # rows are keyed by case_id
+        case_id = sel[0]
+        case = CASES_BY_ID.get(case_id)
         if not case:
             return
         win = tk.Toplevel(self)
         win.title(f"Case {case_id}")
         ttk.Label(win, text=f"Case: {case_id}", font=self.header_font).pack(anchor="w", padx=8, pady=4)
-        ttk.Label(win, text=f"User: {case['user_name']} ({case['user_id']})").pack(anchor="w", padx=8)
-        ttk.Label(win, text=f"Score: {case['score']:.3f}").pack(anchor="w", padx=8, pady=4)
+        ttk.Label(win, text=f"User: {case.user_name} ({case.user_id})").pack(anchor="w", padx=8)
+        ttk.Label(win, text=f"Score: {case.score:.3f}").pack(anchor="w", padx=8, pady=4)
         ttk.Button(win, text="Mark Closed", command=lambda: self.close_case(case, win)).pack(padx=8, pady=8)
 
     def close_case(self, case, win):
-        case["status"] = "Closed"
-        AUDIT_LOG.append({"timestamp": now_ts(), "alert_id": case["alert_id"], "action": "case_closed", "actor": "analyst"})
-        messagebox.showinfo("Closed", f"Case {case['case_id']} closed.")
+        set_case_status(case, "Closed")
+        audit(case.alert_id, "case_closed", "analyst")
+        messagebox.showinfo("Closed", f"Case {case.case_id} closed.")
         win.destroy()
-        self.refresh_actions()
-        self.refresh_dashboard()
+        self._schedule_refresh("dashboard", "actions")
 
     # ---------------------------
     # Gamification Tab
@@ -1305,60 +1782,91 @@ class ITSApp(tk.Tk):
         self.refresh_gamify()
 
     def refresh_gamify(self):
-        # populate leaderboard from USER_POINTS
-        for i in self.lb_tree.get_children():
-            self.lb_tree.delete(i)
-        sorted_users = sorted(USER_POINTS.items(), key=lambda x: x[1], reverse=True)
+        # populate leaderboard from USER_POINTS; rows are keyed by user id and
+        # only inserted, moved or rewritten when a user's rank or points change
+        tree = self.lb_tree
+        row_state = self._lb_row_state
+        sorted_users = heapq.nlargest(LB_VISIBLE_ROWS, USER_POINTS.items(), key=itemgetter(1))
+        gone = row_state.keys() - {uid for uid, _ in sorted_users}
+        if gone:
+            tree.delete(*gone)
+            for uid in gone:
+                del row_state[uid]
         for idx, (uid, pts) in enumerate(sorted_users):
-            name = next((u["name"] for u in MOCK_USERS if u["user_id"]==uid), uid)
+            prev = row_state.get(uid)
+            if prev == (idx, pts):
+                continue
+            row_state[uid] = (idx, pts)
+            name = USER_NAME_BY_ID.get(uid, uid)
             tags = ("row-alt",) if idx % 2 == 1 else ()
-            self.lb_tree.insert("", tk.END, values=(name, pts), tags=tags)
+            if prev is None:
+                tree.insert("", idx, iid=uid, values=(name, pts), tags=tags)
+                continue
+            if prev[0] != idx:
+                tree.move(uid, "", idx)
+            tree.item(uid, values=(name, pts), tags=tags)
         total_points = sum(USER_POINTS.values())
         top_entry = sorted_users[0] if sorted_users else None
         if top_entry:
-            top_name = next((u["name"] for u in MOCK_USERS if u["user_id"] == top_entry[0]), top_entry[0])
+            top_name = USER_NAME_BY_ID.get(top_entry[0], top_entry[0])
             self.leaderboard_top_user_var.set(f"{top_name} ({top_entry[1]} pts)")
         else:
             self.leaderboard_top_user_var.set("Awaiting analyst data")
         self.leaderboard_points_var.set(f"{total_points} pts awarded")
-        badge_total = sum(len(b) for b in BADGES.values())
+        badge_total = sum(mask.bit_count() for mask in BADGES.values())
         self.leaderboard_badges_var.set(f"{badge_total} badges")
 
         self.badge_summary.delete("1.0", tk.END)
         if badge_total == 0:
             self.badge_summary.insert(tk.END, "No badges earned yet. Run the sandbox challenge to unlock the first badge.")
         else:
-            for uid, badges in BADGES.items():
-                if not badges:
-                    continue
-                name = next((u["name"] for u in MOCK_USERS if u["user_id"] == uid), uid)
-                badge_list = ", ".join(sorted(badges))
-                self.badge_summary.insert(tk.END, f"{name}: {badge_list}\n")
+            self.badge_summary.insert(tk.END, "".join(
+                f"{USER_NAME_BY_ID.get(uid, uid)}: {', '.join(n for n, bit in BADGE_BITS.items() if mask & bit)}\n"
+                for uid, mask in BADGES.items() if mask
+            ))
 
     def start_sandbox(self):
         self.sandbox_log.delete("1.0", tk.END)
-        sandbox_alerts = []
-        for i in range(5):
-            ev = simulate_event()
-            alert = process_event_to_alert(ev)
-            sandbox_alerts.append(alert)
-            self.sandbox_log.insert(tk.END, f"[{len(sandbox_alerts)}] Alert {alert['alert_id']} for {alert['event']['user_name']} score {alert['score']:.2f}\n")
-        # Let user triage via simple input dialog loop (simulate analyst)
-        correct = 0
+        sandbox_alerts = process_events_to_alerts(simulate_events_batch(5))
+        self.sandbox_log.insert(tk.END, "".join(
+            f"[{i}] Alert {alert.alert_id} for {alert.event.user_name} score {alert.score:.2f}\n"
+            for i, alert in enumerate(sandbox_alerts, 1)
+        ))
+        # triage in one non-modal window; the drill is scored once every alert is answered
+        win = tk.Toplevel(self)
+        win.title("Sandbox Triage")
+        win.configure(bg=COLOR_BG)
+        container = ttk.Frame(win, style="Main.TFrame", padding=18)
+        container.pack(fill=tk.BOTH, expand=True)
+        ttk.Label(container, text="Mark each alert as a true or false positive.", style="Subtitle.TLabel").pack(anchor="w", pady=(0, 8))
+        answers = {}
         for a in sandbox_alerts:
-            ans = messagebox.askyesno("Sandbox Triage", f"Alert {a['alert_id']} (score {a['score']:.2f})\nMark as true positive?")
-            # simple ground truth heuristic: score>0.6 => true positive
-            truth = a["score"] > 0.60
-            if ans == truth:
-                correct += 1
+            row = ttk.Frame(container, style="Card.TFrame", padding=8)
+            row.pack(fill=tk.X, pady=2)
+            ttk.Label(row, text=f"Alert {a.alert_id} (score {a.score:.2f})").pack(side=tk.LEFT)
+            no = ttk.Button(row, text="False Positive", style="Ghost.TButton")
+            yes = ttk.Button(row, text="True Positive", style="Accent.TButton")
+            for btn, ans in ((yes, True), (no, False)):
+                btn.configure(command=lambda a=a, ans=ans, btns=(yes, no): self.answer_sandbox(win, sandbox_alerts, answers, a, ans, btns))
+                btn.pack(side=tk.RIGHT, padx=4)
+
+    def answer_sandbox(self, win, sandbox_alerts, answers, alert, ans, buttons):
+        answers[alert.alert_id] = ans
+        for btn in buttons:
+            btn.state(["disabled"])
+        if len(answers) < len(sandbox_alerts):
+            return
+        win.destroy()
+        # simple ground truth heuristic: score>0.6 => true positive
+        correct = sum(answers[a.alert_id] == (a.score > 0.60) for a in sandbox_alerts)
         points_awarded = correct * 10
         # award to random analyst
         analyst = random.choice(MOCK_USERS)
         USER_POINTS[analyst["user_id"]] += points_awarded
         # badges
-        if correct == 5:
-            BADGES[analyst["user_id"]].add("Sandbox Master")
-        self.sandbox_log.insert(tk.END, f"\nResult: {correct}/5 correct. {points_awarded} points awarded to {analyst['name']}.\n")
+        if correct == len(sandbox_alerts):
+            BADGES[analyst["user_id"]] |= BADGE_BITS["Sandbox Master"]
+        self.sandbox_log.insert(tk.END, f"\nResult: {correct}/{len(sandbox_alerts)} correct. {points_awarded} points awarded to {analyst['name']}.\n")
         self.refresh_gamify()
 
     # ---------------------------
@@ -1384,8 +1892,7 @@ class ITSApp(tk.Tk):
         ttk.Checkbutton(auto_card, text="Enable Auto Remediation", variable=self.auto_action_enabled, style="Settings.TCheckbutton").pack(anchor="w")
         ttk.Label(auto_card, text="Auto threshold (0-1)", style="CardTitle.TLabel").pack(anchor="w", pady=(10, 2))
         ttk.Label(auto_card, textvariable=self.auto_threshold_label_var, style="InfoValue.TLabel").pack(anchor="w")
-        ttk.Scale(auto_card, from_=0.0, to=1.0, orient=tk.HORIZONTAL, variable=self.auto_threshold,
-                  command=lambda v: self.auto_threshold_label_var.set(f"{float(v):.2f}")).pack(fill=tk.X, pady=(4, 8))
+        ttk.Scale(auto_card, from_=0.0, to=1.0, orient=tk.HORIZONTAL, variable=self.auto_threshold).pack(fill=tk.X, pady=(4, 8))
         ttk.Button(auto_card, text="Run Auto Sweep Now", style="Accent.TButton", command=self.run_auto_sweep).pack(fill=tk.X, pady=(8, 0))
 
         resources_card = ttk.Frame(content, style="Card.TFrame", padding=20)
@@ -1399,38 +1906,57 @@ class ITSApp(tk.Tk):
         ttk.Button(resources_card, text="Simulate Event", style="Ghost.TButton", command=self.manual_simulate_event).pack(fill=tk.X, pady=4)
         ttk.Label(resources_card, text="Need more controls? Extend this panel with API keys, alert routing, and directory sync options.", style="InfoLabel.TLabel").pack(anchor="w", pady=(12, 0))
 
+    def build_gradient_strip(self):
+        """Rasterize the vertical gradient once: a 1px-wide image with one row per band."""
+        strip = tk.PhotoImage(master=self, width=1, height=GRADIENT_STEPS)
+        strip.put(" ".join(
+            "{%s}" % blend_hex(COLOR_GRADIENT_TOP, COLOR_GRADIENT_BOTTOM, i / GRADIENT_STEPS)
+            for i in range(GRADIENT_STEPS)
+        ))
+        return strip
+
+    def schedule_threshold_label(self, *args):
+        # a Scale drag writes the variable on every pixel; relabel at most every 50ms
+        if self._threshold_label_job is None:
+            self._threshold_label_job = self.after(50, self.update_threshold_label)
+
+    def update_threshold_label(self):
+        self._threshold_label_job = None
+        self.auto_threshold_label_var.set(f"{self.auto_threshold.get():.2f}")
+
+    def schedule_background_redraw(self, event=None):
+        # <Configure> fires for every child widget too; coalesce into one redraw
+        if self._bg_redraw_job is not None:
+            self.after_cancel(self._bg_redraw_job)
+        self._bg_redraw_job = self.after(50, self.draw_background_gradient)
+
     def draw_background_gradient(self, event=None):
+        self._bg_redraw_job = None
         if not hasattr(self, "background_canvas"):
             return
         width = max(1, self.winfo_width())
         height = max(1, self.winfo_height())
-        self.background_canvas.delete("gradient")
-        steps = 80
-        for i in range(steps):
-            ratio = i / steps
-            color = blend_hex(COLOR_GRADIENT_TOP, COLOR_GRADIENT_BOTTOM, ratio)
-            y0 = int(i * height / steps)
-            y1 = int((i + 1) * height / steps)
-            self.background_canvas.create_rectangle(0, y0, width, y1, fill=color, outline="", tags="gradient")
-        self.background_canvas.create_oval(
-            width * 0.6,
-            -height * 0.3,
-            width * 1.1,
-            height * 0.2,
-            fill=blend_hex(COLOR_GLOW, COLOR_BG, 0.4),
-            outline="",
-            tags="gradient"
-        )
-        self.background_canvas.create_oval(
-            -width * 0.2,
-            height * 0.55,
-            width * 0.35,
-            height * 1.1,
-            fill=blend_hex(COLOR_ACCENT_ALT, COLOR_BG, 0.7),
-            outline="",
-            tags="gradient"
+        if (width, height) == self._bg_size:
+            return
+        self._bg_size = (width, height)
+        canvas = self.background_canvas
+        # scale the prebuilt strip in C instead of drawing each band from Python
+        self._bg_image = self._bg_strip.zoom(width, -(-height // GRADIENT_STEPS))
+        glow = (width * 0.6, -height * 0.3, width * 1.1, height * 0.2)
+        accent = (-width * 0.2, height * 0.55, width * 0.35, height * 1.1)
+        if self._bg_items is not None:
+            # resize: move the existing items rather than recreating them
+            image_id, glow_id, accent_id = self._bg_items
+            canvas.itemconfigure(image_id, image=self._bg_image)
+            canvas.coords(glow_id, *glow)
+            canvas.coords(accent_id, *accent)
+            return
+        self._bg_items = (
+            canvas.create_image(0, 0, anchor="nw", image=self._bg_image, tags="gradient"),
+            canvas.create_oval(*glow, fill=blend_hex(COLOR_GLOW, COLOR_BG, 0.4), outline="", tags="gradient"),
+            canvas.create_oval(*accent, fill=blend_hex(COLOR_ACCENT_ALT, COLOR_BG, 0.7), outline="", tags="gradient"),
         )
-        self.background_canvas.lower("all")
+        canvas.lower("all")
 
     # ---------------------------
     # Simulation Loop
@@ -1440,10 +1966,10 @@ class ITSApp(tk.Tk):
         ev = simulate_event()
         alert = process_event_to_alert(ev)
         # If auto action enabled and score above threshold, take action
-        if self.auto_action_enabled.get() and alert["score"] >= self.auto_threshold.get():
+        if self.auto_action_enabled.get() and alert.score >= self.auto_threshold.get():
             take_automated_action(alert, "isolate_endpoint", actor="auto-sim")
-        # keep UI updated
-        self.refresh_dashboard()
+        # keep UI updated (coalesced with any other pending refresh)
+        self._schedule_refresh()
         # schedule next
         self.after(SIM_EVENT_INTERVAL * 1000, self.simulation_loop)
 
@@ -1453,9 +1979,7 @@ class ITSApp(tk.Tk):
 # ---------------------------
 def main():
     # prepare a few simulated historical events
-    for _ in range(8):
-        ev = simulate_event()
-        process_event_to_alert(ev)
+    process_events_to_alerts(simulate_events_batch(8))
     app = ITSApp()
     app.mainloop()
 